@@ -61,12 +61,16 @@ DRONEID_DRONE_TYPES = {
 CRC_INIT = 0x3692
 CRC_POLY = 0x11021
 
+# Built once; crcmod backs this with its table-driven C extension when available
+_crc16 = crcmod.mkCrcFun(CRC_POLY, initCrc = CRC_INIT, rev=True)
+
 class DroneIDPacket:
     """Decode DUML payload to JSON."""
-    droneid = {}
 
     def __init__(self, raw_bytes):
         self.raw_bytes = raw_bytes
+        # Per-instance, so a parsed packet is not overwritten by later parses
+        self.droneid = {}
 
         droneid_pack = struct.unpack("<BBBHH16siihhhhhhQiiiiBB20sH",raw_bytes[0:DRONEID_MAX_LEN])
         self.droneid["pkt_len"]         = droneid_pack[0]
@@ -118,10 +122,8 @@ class DroneIDPacket:
 
     def crc(self) -> str:
         """Calculate CRC of the packet."""
-        crc = crcmod.mkCrcFun(CRC_POLY, initCrc = CRC_INIT, rev=True)
         # CRC is appended to the packet
-        crc(self.raw_bytes[:DRONEID_MAX_LEN-2])
-        return "%04x" % crc(self.raw_bytes[:DRONEID_MAX_LEN-2])
+        return "%04x" % _crc16(self.raw_bytes[:DRONEID_MAX_LEN-2])
 
     def check_crc(self) -> bool:
         """Returns True if the CRC matches, false otherwise."""
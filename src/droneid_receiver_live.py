@@ -245,68 +245,83 @@ def decoded_to_file(raw_bits: bytes, filepath: Path) -> None:
         safe_write_bytes(filepath, raw_bits, append=True)
 
 
-def format_output_json(payload: DroneIDPacket, frequency: float = None) -> str:
-    """Format DroneID payload as valid JSON with timestamp.
+def _build_output_dict(payload: DroneIDPacket, frequency: float = None) -> dict:
+    """Build the output record for a DroneID payload, before serialization.
     
     Args:
         payload: Decoded DroneID packet
         frequency: Optional center frequency in Hz
         
     Returns:
-        Valid JSON string representation with all telemetry fields
+        Dictionary with timestamps and all telemetry fields
         
     **Validates: Requirements 7.1**
     """
-    try:
-        # Build output dictionary with timestamp and all telemetry fields
-        output = {
-            "timestamp": datetime.now().isoformat(),
-            "reception_time_utc": datetime.utcnow().isoformat() + "Z",
+    # Build output dictionary with timestamp and all telemetry fields
+    output = {
+        "timestamp": datetime.now().isoformat(),
+        "reception_time_utc": datetime.utcnow().isoformat() + "Z",
+    }
+    
+    # Add frequency if provided
+    if frequency is not None:
+        output["frequency_mhz"] = frequency / 1e6
+    
+    # Extract all telemetry fields from the DroneID packet
+    if hasattr(payload, 'droneid') and isinstance(payload.droneid, dict):
+        # Include all parsed fields from the packet
+        output["telemetry"] = {
+            "serial_number": payload.droneid.get("serial_number", ""),
+            "device_type": payload.droneid.get("device_type", "Unknown"),
+            "position": {
+                "latitude": payload.droneid.get("latitude", 0.0),
+                "longitude": payload.droneid.get("longitude", 0.0),
+                "altitude_m": payload.droneid.get("altitude", 0.0),
+                "height_m": payload.droneid.get("height", 0.0),
+            },
+            "velocity": {
+                "north": payload.droneid.get("v_north", 0),
+                "east": payload.droneid.get("v_east", 0),
+                "up": payload.droneid.get("v_up", 0),
+            },
+            "home_position": {
+                "latitude": payload.droneid.get("latitude_home", 0.0),
+                "longitude": payload.droneid.get("longitude_home", 0.0),
+            },
+            "operator_position": {
+                "latitude": payload.droneid.get("app_lat", 0.0),
+                "longitude": payload.droneid.get("app_lon", 0.0),
+            },
+            "gps_time": payload.droneid.get("gps_time", 0),
+            "sequence_number": payload.droneid.get("sequence_number", 0),
+            "uuid": payload.droneid.get("uuid", ""),
         }
         
-        # Add frequency if provided
-        if frequency is not None:
-            output["frequency_mhz"] = frequency / 1e6
+        # Add CRC validation status
+        output["crc_valid"] = payload.check_crc()
+        output["crc_packet"] = payload.droneid.get("crc-packet", "")
+        output["crc_calculated"] = payload.droneid.get("crc-calculated", "")
+    else:
+        # Fallback: include raw payload string
+        output["raw_payload"] = str(payload)
+    
+    return output
+
+
+def format_output_json(payload: DroneIDPacket, frequency: float = None) -> str:
+    """Format DroneID payload as valid JSON with timestamp.
+    
+    Args:
+        payload: Decoded DroneID packet
+        frequency: Optional center frequency in Hz
         
-        # Extract all telemetry fields from the DroneID packet
-        if hasattr(payload, 'droneid') and isinstance(payload.droneid, dict):
-            # Include all parsed fields from the packet
-            output["telemetry"] = {
-                "serial_number": payload.droneid.get("serial_number", ""),
-                "device_type": payload.droneid.get("device_type", "Unknown"),
-                "position": {
-                    "latitude": payload.droneid.get("latitude", 0.0),
-                    "longitude": payload.droneid.get("longitude", 0.0),
-                    "altitude_m": payload.droneid.get("altitude", 0.0),
-                    "height_m": payload.droneid.get("height", 0.0),
-                },
-                "velocity": {
-                    "north": payload.droneid.get("v_north", 0),
-                    "east": payload.droneid.get("v_east", 0),
-                    "up": payload.droneid.get("v_up", 0),
-                },
-                "home_position": {
-                    "latitude": payload.droneid.get("latitude_home", 0.0),
-                    "longitude": payload.droneid.get("longitude_home", 0.0),
-                },
-                "operator_position": {
-                    "latitude": payload.droneid.get("app_lat", 0.0),
-                    "longitude": payload.droneid.get("app_lon", 0.0),
-                },
-                "gps_time": payload.droneid.get("gps_time", 0),
-                "sequence_number": payload.droneid.get("sequence_number", 0),
-                "uuid": payload.droneid.get("uuid", ""),
-            }
-            
-            # Add CRC validation status
-            output["crc_valid"] = payload.check_crc()
-            output["crc_packet"] = payload.droneid.get("crc-packet", "")
-            output["crc_calculated"] = payload.droneid.get("crc-calculated", "")
-        else:
-            # Fallback: include raw payload string
-            output["raw_payload"] = str(payload)
+    Returns:
+        Valid JSON string representation with all telemetry fields
         
-        return json.dumps(output, indent=2, ensure_ascii=False)
+    **Validates: Requirements 7.1**
+    """
+    try:
+        return json.dumps(_build_output_dict(payload, frequency), indent=2, ensure_ascii=False)
     except Exception as e:
         # Return error JSON if formatting fails
         error_output = {
@@ -7,7 +7,7 @@ This module manages frequency hopping and locking behavior for scanning
 """
 
 from enum import Enum
-from typing import Optional, TYPE_CHECKING
+from typing import Iterable, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from bladerf_receiver import BladeRFReceiver
@@ -153,6 +153,29 @@ class FrequencyScanner:
                 if self._empty_scan_count >= self.UNLOCK_THRESHOLD:
                     self.unlock_frequency()
     
+    def record_detections_bulk(self, detections: Iterable[bool]) -> int:
+        """Record a run of detection results in one call.
+        
+        Equivalent to calling record_detection() for each result, except
+        that it stops as soon as the scanner is no longer locked (further
+        results would not change the state).
+        
+        Args:
+            detections: Detection results in scan order
+            
+        Returns:
+            Number of results consumed
+            
+        **Validates: Requirements 2.3, 2.4**
+        """
+        consumed = 0
+        for detected in detections:
+            if self._state != ScanState.LOCKED:
+                break
+            self.record_detection(detected)
+            consumed += 1
+        return consumed
+    
     def get_next_frequency(self) -> float:
         """Get next frequency to scan.
         
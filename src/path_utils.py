@@ -6,10 +6,15 @@ DJI DroneID Live Receiver, ensuring Windows compatibility.
 **Validates: Requirements 5.3, 7.3**
 """
 
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Sequence, Union
 import os
+import re
+
+# Characters Windows does not allow in a file name
+_INVALID_WINDOWS_CHARS = re.compile(r'[<>:"|?*]')
 
 
 def get_output_directory(base_dir: Optional[str] = None) -> Path:
@@ -45,9 +50,17 @@ def create_timestamped_filename(prefix: str, extension: str,
     if timestamp is None:
         timestamp = datetime.now()
     
-    # Format: prefix_DDMM_HHMM.extension
-    time_str = f"{timestamp.day:02d}{timestamp.month:02d}_{timestamp.hour:02d}{timestamp.minute:02d}"
-    return f"{prefix}_{time_str}.{extension}"
+    # Keyed on the minute actually used in the name, so "now" calls within
+    # the same minute share an entry and never return a stale name
+    return _format_timestamped_filename(prefix, extension, timestamp.day, timestamp.month,
+                                        timestamp.hour, timestamp.minute)
+
+
+@lru_cache(maxsize=1024)
+def _format_timestamped_filename(prefix: str, extension: str, day: int, month: int,
+                                 hour: int, minute: int) -> str:
+    """Build prefix_DDMM_HHMM.extension (cached)."""
+    return f"{prefix}_{day:02d}{month:02d}_{hour:02d}{minute:02d}.{extension}"
 
 
 def get_output_filepath(filename: str, base_dir: Optional[str] = None) -> Path:
@@ -120,6 +133,7 @@ def create_decoded_bits_filepath(timestamp: Optional[datetime] = None,
     return get_output_filepath(filename, base_dir)
 
 
+@lru_cache(maxsize=1024)
 def normalize_path(path_str: str) -> Path:
     """Normalize a path string to a Path object with Windows compatibility.
     
@@ -131,7 +145,8 @@ def normalize_path(path_str: str) -> Path:
         
     **Validates: Requirements 5.3**
     """
-    # Path handles both forward and back slashes automatically
+    # Path handles both forward and back slashes automatically. Path objects
+    # are immutable, so repeated strings can share one cached instance.
     return Path(path_str)
 
 
@@ -162,16 +177,14 @@ def is_valid_output_path(path: Path) -> bool:
     **Validates: Requirements 5.3**
     """
     try:
+        # Check for invalid characters on Windows (filename only); done
+        # first since it needs no filesystem access
+        if os.name == 'nt' and _INVALID_WINDOWS_CHARS.search(path.name):
+            return False
+        
         # Check if path is absolute or can be resolved
         resolved = path.resolve()
         
-        # Check for invalid characters on Windows
-        if os.name == 'nt':
-            invalid_chars = '<>:"|?*'
-            path_str = str(path.name)  # Check filename only
-            if any(c in path_str for c in invalid_chars):
-                return False
-        
         # Check if parent directory exists or can be created
         parent = resolved.parent
         if parent.exists():
@@ -184,12 +197,14 @@ def is_valid_output_path(path: Path) -> bool:
         return False
 
 
-def safe_write_bytes(filepath: Path, data: bytes, append: bool = True) -> bool:
+def safe_write_bytes(filepath: Path, data: Union[bytes, Sequence[bytes]],
+                     append: bool = True) -> bool:
     """Safely write bytes to a file with Windows compatibility.
     
     Args:
         filepath: Path to write to
-        data: Bytes to write
+        data: Bytes (or any buffer) to write, or a list/tuple of chunks;
+            chunks are joined and written with a single write call
         append: If True, append to file; if False, overwrite
         
     Returns:
@@ -199,6 +214,8 @@ def safe_write_bytes(filepath: Path, data: bytes, append: bool = True) -> bool:
     """
     try:
         mode = 'ab' if append else 'wb'
+        if isinstance(data, (list, tuple)):
+            data = b"".join(data)
         with open(filepath, mode) as f:
             f.write(data)
         return True
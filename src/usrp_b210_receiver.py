@@ -16,6 +16,11 @@ import uhd
 import time
 from typing import Optional, Tuple
 
+# RX metadata error codes as plain ints, so the per-packet check in
+# receive_samples doesn't resolve the enum members on every iteration
+_RX_ERROR_NONE = int(uhd.types.RXMetadataErrorCode.none)
+_RX_ERROR_OVERFLOW = int(uhd.types.RXMetadataErrorCode.overflow)
+
 
 class DeviceNotFoundError(Exception):
     """Raised when USRP B210 device is not found."""
@@ -67,6 +72,11 @@ class USRPB210Receiver:
         self.antenna = antenna
         self.current_frequency = None
         
+        # RX errors seen in receive_samples, reported on close() so the
+        # receive loop never blocks on console output
+        self._rx_errors = 0
+        self._last_rx_error = None
+        
         # Validate sample rate (B210 supports up to 56 MHz)
         if sample_rate > 56e6:
             raise ConfigurationError(
@@ -125,7 +135,8 @@ class USRPB210Receiver:
             else:
                 raise ConfigurationError(f"Failed to initialize B210: {e}") from e
     
-    def set_frequency(self, frequency: float, settling_time: float = 0.05) -> bool:
+    def set_frequency(self, frequency: float, settling_time: float = 0.05,
+                      integer_n: bool = False) -> bool:
         """Set center frequency with proper settling time.
         
         The B210 needs time for the LO to lock after frequency changes.
@@ -134,6 +145,9 @@ class USRPB210Receiver:
         Args:
             frequency: Center frequency in Hz
             settling_time: Time to wait after tuning (seconds)
+            integer_n: Request integer-N LO tuning; the DDC absorbs the
+                residual offset, which keeps PLL relocks short when
+                hopping between channels
             
         Returns:
             True if successful, False otherwise
@@ -141,6 +155,8 @@ class USRPB210Receiver:
         try:
             # Tune to frequency
             tune_request = uhd.libpyuhd.types.tune_request(frequency)
+            if integer_n:
+                tune_request.args = uhd.libpyuhd.types.device_addr("mode_n=integer")
             tune_result = self.usrp.set_rx_freq(tune_request, 0)
             
             # Verify tuning
@@ -158,7 +174,32 @@ class USRPB210Receiver:
         except Exception as e:
             print(f"Error setting frequency: {e}")
             return False
-    
+
+    def _issue_stream_cmds(self, num_samples: int) -> None:
+        """Queue the stream commands for a capture of num_samples.
+
+        The capture is split into two chained commands issued back-to-back:
+        a num_more command for the first half followed by a num_done command
+        for the remainder. The second command is already queued on the B210
+        when the first completes, so the device never runs out of
+        outstanding requests and the two halves stay contiguous.
+
+        Args:
+            num_samples: Total number of complex samples to stream
+        """
+        first = num_samples // 2
+
+        if first > 0:
+            stream_cmd = uhd.types.StreamCMD(uhd.types.StreamMode.num_more)
+            stream_cmd.num_samps = first
+            stream_cmd.stream_now = True
+            self.streamer.issue_stream_cmd(stream_cmd)
+
+        stream_cmd = uhd.types.StreamCMD(uhd.types.StreamMode.num_done)
+        stream_cmd.num_samps = num_samples - first
+        stream_cmd.stream_now = True
+        self.streamer.issue_stream_cmd(stream_cmd)
+
     def receive_samples(self, num_samples: int, timeout: float = 5.0) -> Optional[np.ndarray]:
         """Receive IQ samples from B210.
         
@@ -170,36 +211,33 @@ class USRPB210Receiver:
             Complex64 numpy array of IQ samples, or None on error
         """
         try:
-            # Allocate output buffer
-            samples = np.zeros(num_samples, dtype=np.complex64)
+            # Reuse the receive buffer across captures; it is only
+            # reallocated when a larger capture size is requested
+            if len(self.recv_buffer) < num_samples:
+                self.recv_buffer = np.empty(num_samples, dtype=np.complex64)
+            samples = self.recv_buffer[:num_samples]
             
             # Set up streaming
-            stream_cmd = uhd.types.StreamCMD(uhd.types.StreamMode.num_done)
-            stream_cmd.num_samps = num_samples
-            stream_cmd.stream_now = True
-            self.streamer.issue_stream_cmd(stream_cmd)
-            
-            # Receive samples in chunks to avoid overflow
+            self._issue_stream_cmds(num_samples)
+
+            # Hand UHD the whole remaining buffer so it fills as many packets
+            # as it can per call; recv only returns early on errors/timeouts
             samples_received = 0
             metadata = uhd.types.RXMetadata()
-            max_samps_per_packet = self.streamer.get_max_num_samps()
             
             while samples_received < num_samples:
-                # Calculate how many samples to request this iteration
-                samps_to_recv = min(max_samps_per_packet, num_samples - samples_received)
-                
-                # Receive chunk
                 samps = self.streamer.recv(
-                    samples[samples_received:samples_received + samps_to_recv],
+                    samples[samples_received:],
                     metadata,
                     timeout
                 )
                 
                 # Check for errors (suppress overflow - it's normal and expected)
-                if metadata.error_code != uhd.types.RXMetadataErrorCode.none:
-                    if metadata.error_code != uhd.types.RXMetadataErrorCode.overflow:
-                        print(f"RX error: {metadata.strerror()}")
-                    # Overflow is normal with high sample rates - silently continue
+                error_code = int(metadata.error_code)
+                if error_code != _RX_ERROR_NONE and error_code != _RX_ERROR_OVERFLOW:
+                    self._rx_errors += 1
+                    self._last_rx_error = metadata.strerror()
+                # Overflow is normal with high sample rates - silently continue
                 
                 samples_received += samps
                 
@@ -215,7 +253,30 @@ class USRPB210Receiver:
         except Exception as e:
             print(f"Error receiving samples: {e}")
             return None
-    
+
+    def receive_samples_planar(self, num_samples: int,
+                               timeout: float = 5.0) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """Receive IQ samples from B210 as separate I and Q arrays.
+
+        The streamer delivers interleaved complex64 samples. This splits
+        them into two contiguous float32 arrays so downstream vectorized
+        kernels can load runs of I or Q values without striding.
+
+        Args:
+            num_samples: Number of complex samples to receive
+            timeout: Timeout in seconds
+
+        Returns:
+            Tuple of (i, q) float32 arrays, or None on error
+        """
+        samples = self.receive_samples(num_samples, timeout)
+        if samples is None:
+            return None
+
+        # View as (N, 2) float32 pairs and copy each column out contiguously
+        iq = samples.view(np.float32).reshape(-1, 2)
+        return np.ascontiguousarray(iq[:, 0]), np.ascontiguousarray(iq[:, 1])
+
     def close(self):
         """Clean up USRP resources."""
         try:
@@ -225,6 +286,9 @@ class USRPB210Receiver:
         except Exception:
             pass
         
+        if self._rx_errors:
+            print(f"RX errors during session: {self._rx_errors} (last: {self._last_rx_error})")
+        
         # USRP object will be cleaned up by Python GC
         print("USRP B210 closed")
     
@@ -267,7 +331,7 @@ def test_b210():
         
         for freq in test_freqs:
             print(f"  Tuning to {freq/1e6:.2f} MHz...")
-            if receiver.set_frequency(freq):
+            if receiver.set_frequency(freq, integer_n=True):
                 print(f"    ✓ Success")
             else:
                 print(f"    ✗ Failed")
@@ -278,7 +342,8 @@ def test_b210():
         
         if samples is not None:
             print(f"  ✓ Received {len(samples)} samples")
-            print(f"  Sample stats: mean={np.mean(np.abs(samples)):.3f}, max={np.max(np.abs(samples)):.3f}")
+            magnitude = np.abs(samples)
+            print(f"  Sample stats: mean={magnitude.mean():.3f}, max={magnitude.max():.3f}")
         else:
             print(f"  ✗ Failed to receive samples")
         
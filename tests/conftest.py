@@ -1,8 +1,53 @@
 """Pytest configuration and fixtures for DJI DroneID Live Receiver tests."""
 
+import os
 import sys
 from pathlib import Path
 
+import numpy as np
+import pytest
+from hypothesis import Verbosity, settings
+
 # Add src directory to path for imports
-src_path = Path(__file__).parent.parent / "src"
+src_path = Path(__file__).resolve().parent.parent / "src"
 sys.path.insert(0, str(src_path))
+
+# Hypothesis profiles: select with HYPOTHESIS_PROFILE=dev|ci|nightly.
+# Tests without an explicit max_examples inherit the active profile.
+settings.register_profile("dev", max_examples=10)
+settings.register_profile("ci", max_examples=50)
+settings.register_profile("nightly", max_examples=200)
+settings.load_profile(os.environ.get("HYPOTHESIS_PROFILE", "dev"))
+
+# For cheap, always-terminating properties (e.g. CLI parsing): no example
+# database I/O, no deadline, fixed seed. Inherits the active profile's
+# example budget. Apply with @settings(settings.get_profile("cli_fast")).
+settings.register_profile(
+    "cli_fast",
+    parent=settings.default,
+    database=None,
+    deadline=None,
+    print_blob=False,
+    verbosity=Verbosity.quiet,
+    derandomize=True,
+)
+
+
+@pytest.fixture(scope="session")
+def rng():
+    """Seeded PCG64 generator shared by tests that just need random input.
+    
+    Draw float32 directly (e.g. standard_normal(n, dtype=np.float32))
+    rather than float64 from the legacy np.random functions and casting.
+    """
+    return np.random.default_rng(12345)
+
+
+def pytest_configure(config):
+    """Register markers so the suite also runs without pytest-xdist."""
+    config.addinivalue_line(
+        "markers", "xdist_group(name): run all tests in the group on one xdist worker"
+    )
+    config.addinivalue_line(
+        "markers", "slow: full-capture DSP tests; deselect with -m \"not slow\""
+    )
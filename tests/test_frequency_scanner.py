@@ -4,12 +4,22 @@
 **Validates: Requirements 2.1, 2.2, 2.3, 2.4, 2.5**
 """
 
+import numpy as np
 import pytest
 from hypothesis import given, strategies as st, settings, assume
 
 from frequency_scanner import FrequencyScanner, ScanState
 
 
+@pytest.fixture(scope="module")
+def shared_scanner():
+    """One default scanner for read-only tests.
+    
+    Tests that change its state must call reset() first.
+    """
+    return FrequencyScanner()
+
+
 class TestFrequencyLockStateMachine:
     """Property tests for frequency lock state machine.
     
@@ -18,9 +28,11 @@ class TestFrequencyLockStateMachine:
     """
     
     @given(st.lists(
-        st.booleans(),
+        # Detections ~10% of the time, so a good share of sequences contain
+        # a run of 10 empty scans and exercise the unlock path
+        st.integers(min_value=0, max_value=9).map(lambda x: x == 0),
         min_size=1,
-        max_size=50
+        max_size=25
     ))
     @settings(max_examples=100)
     def test_lock_state_machine_behavior(self, detection_sequence):
@@ -40,32 +52,34 @@ class TestFrequencyLockStateMachine:
         assert scanner.state == ScanState.LOCKED
         assert scanner.locked_frequency == test_frequency
         
-        consecutive_empty = 0
+        # Length of the empty-scan run ending at each index, in one pass:
+        # distance back to the most recent detection
+        detections = np.array(detection_sequence, dtype=bool)
+        index = np.arange(len(detections))
+        last_detection = np.maximum.accumulate(np.where(detections, index, -1))
+        empty_run = index - last_detection
         
-        for detected in detection_sequence:
-            # Record the detection result
-            scanner.record_detection(detected)
+        # Index of the scan that should trigger the unlock, if any
+        unlock_points = np.flatnonzero(empty_run >= FrequencyScanner.UNLOCK_THRESHOLD)
+        
+        if unlock_points.size == 0:
+            # Never reaches the threshold: stays locked, counter tracks the run
+            scanner.record_detections_bulk(detection_sequence)
+            assert scanner.state == ScanState.LOCKED
+            assert scanner.locked_frequency == test_frequency
+            assert scanner.empty_scan_count == empty_run[-1]
+        else:
+            unlock_at = unlock_points[0]
             
-            if detected:
-                # Detection resets the counter
-                consecutive_empty = 0
-                # Should remain locked
-                if scanner.state == ScanState.LOCKED:
-                    assert scanner.locked_frequency == test_frequency
-            else:
-                consecutive_empty += 1
+            # Still locked one scan before the threshold...
+            scanner.record_detections_bulk(detection_sequence[:unlock_at])
+            assert scanner.state == ScanState.LOCKED
+            assert scanner.empty_scan_count == FrequencyScanner.UNLOCK_THRESHOLD - 1
             
-            # Check state based on consecutive empty count
-            if consecutive_empty >= 10:
-                # Should have unlocked
-                assert scanner.state == ScanState.SCANNING
-                assert scanner.locked_frequency is None
-                # Once unlocked, further detections don't re-lock automatically
-                break
-            else:
-                # Should still be locked (if we haven't unlocked yet)
-                if scanner.state == ScanState.LOCKED:
-                    assert scanner.empty_scan_count == consecutive_empty
+            # ...and unlocked by the scan that reaches it
+            scanner.record_detection(detection_sequence[unlock_at])
+            assert scanner.state == ScanState.SCANNING
+            assert scanner.locked_frequency is None
     
     @given(st.integers(min_value=0, max_value=9))
     @settings(max_examples=100)
@@ -84,16 +98,14 @@ class TestFrequencyLockStateMachine:
         scanner.lock_frequency(test_frequency)
         
         # Record empty scans (less than threshold)
-        for _ in range(num_empty_scans):
-            scanner.record_detection(False)
+        scanner.record_detections_bulk([False] * num_empty_scans)
         
         # Should still be locked
         assert scanner.state == ScanState.LOCKED
         assert scanner.locked_frequency == test_frequency
         assert scanner.empty_scan_count == num_empty_scans
     
-    @given(st.integers(min_value=10, max_value=20))
-    @settings(max_examples=100)
+    @pytest.mark.parametrize("num_empty_scans", [10, 11, 15, 20])
     def test_unlocks_at_threshold(self, num_empty_scans):
         """
         **Feature: bladerf-a4-refactor, Property 2: Frequency Lock State Machine**
@@ -108,9 +120,10 @@ class TestFrequencyLockStateMachine:
         # Lock to frequency
         scanner.lock_frequency(test_frequency)
         
-        # Record empty scans (at or above threshold)
-        for _ in range(num_empty_scans):
-            scanner.record_detection(False)
+        # Record empty scans (at or above threshold); the run stops
+        # being consumed at the unlock
+        consumed = scanner.record_detections_bulk([False] * num_empty_scans)
+        assert consumed == FrequencyScanner.UNLOCK_THRESHOLD
         
         # Should be unlocked
         assert scanner.state == ScanState.SCANNING
@@ -161,22 +174,29 @@ class TestSampleDurationCalculation:
     **Validates: Requirements 2.5**
     """
     
+    @pytest.mark.parametrize("via", ["ctor", "call"])
     @given(
         st.floats(min_value=0.1, max_value=10.0, allow_nan=False, allow_infinity=False),
         st.floats(min_value=1e6, max_value=100e6, allow_nan=False, allow_infinity=False)
     )
-    @settings(max_examples=100)
-    def test_sample_count_equals_duration_times_rate(self, duration, sample_rate):
+    @settings(max_examples=50)
+    def test_sample_count_equals_duration_times_rate(self, via, duration, sample_rate):
         """
         **Feature: bladerf-a4-refactor, Property 3: Sample Duration Calculation**
         **Validates: Requirements 2.5**
         
-        For any configured duration and sample rate, the number of samples
+        For any duration and sample rate, whether configured on the scanner
+        ("ctor") or passed as overrides ("call"), the number of samples
         captured SHALL equal duration × sample_rate (within rounding tolerance).
         """
-        scanner = FrequencyScanner(duration=duration, sample_rate=sample_rate)
+        if via == "ctor":
+            scanner = FrequencyScanner(duration=duration, sample_rate=sample_rate)
+            num_samples = scanner.calculate_num_samples()
+        else:
+            # Different defaults, so the overrides must win
+            scanner = FrequencyScanner(duration=1.0, sample_rate=10e6)
+            num_samples = scanner.calculate_num_samples(duration=duration, sample_rate=sample_rate)
         
-        num_samples = scanner.calculate_num_samples()
         expected = duration * sample_rate
         
         # Should be within 1 sample of expected (due to int truncation)
@@ -185,28 +205,6 @@ class TestSampleDurationCalculation:
         # Should be exactly int(duration * sample_rate)
         assert num_samples == int(expected)
     
-    @given(
-        st.floats(min_value=0.1, max_value=5.0, allow_nan=False, allow_infinity=False),
-        st.floats(min_value=1e6, max_value=100e6, allow_nan=False, allow_infinity=False)
-    )
-    @settings(max_examples=100)
-    def test_sample_count_with_override_params(self, duration, sample_rate):
-        """
-        **Feature: bladerf-a4-refactor, Property 3: Sample Duration Calculation**
-        **Validates: Requirements 2.5**
-        
-        For any duration and sample rate passed as parameters, the calculation
-        SHALL use those values instead of instance defaults.
-        """
-        # Create scanner with different defaults
-        scanner = FrequencyScanner(duration=1.0, sample_rate=10e6)
-        
-        # Calculate with override parameters
-        num_samples = scanner.calculate_num_samples(duration=duration, sample_rate=sample_rate)
-        expected = int(duration * sample_rate)
-        
-        assert num_samples == expected
-    
     @settings(max_examples=100)
     @given(st.floats(min_value=0.5, max_value=3.0, allow_nan=False, allow_infinity=False))
     def test_default_sample_rate_calculation(self, duration):
@@ -249,18 +247,15 @@ class TestFrequencyListCorrectness:
         ]
         assert FrequencyScanner.FREQUENCIES_5_8GHZ == expected
     
-    def test_all_frequencies_combined(self):
+    def test_all_frequencies_combined(self, shared_scanner):
         """Test that all_frequencies contains both bands."""
-        scanner = FrequencyScanner()
-        all_freqs = scanner.all_frequencies
+        all_freqs = shared_scanner.all_frequencies
+        all_set = set(all_freqs)
         
-        # Should contain all 2.4 GHz frequencies
-        for freq in FrequencyScanner.FREQUENCIES_2_4GHZ:
-            assert freq in all_freqs
-        
-        # Should contain all 5.8 GHz frequencies
-        for freq in FrequencyScanner.FREQUENCIES_5_8GHZ:
-            assert freq in all_freqs
+        # Should contain both bands, with no duplicates
+        assert set(FrequencyScanner.FREQUENCIES_2_4GHZ) <= all_set
+        assert set(FrequencyScanner.FREQUENCIES_5_8GHZ) <= all_set
+        assert len(all_set) == len(all_freqs)
         
         # Total count should be sum of both bands
         expected_count = len(FrequencyScanner.FREQUENCIES_2_4GHZ) + len(FrequencyScanner.FREQUENCIES_5_8GHZ)
@@ -325,9 +320,10 @@ class TestLockUnlockTransitions:
         for _ in range(5):
             assert scanner.get_next_frequency() == test_freq
     
-    def test_get_next_frequency_cycles_when_scanning(self):
+    def test_get_next_frequency_cycles_when_scanning(self, shared_scanner):
         """Test that get_next_frequency cycles through all frequencies."""
-        scanner = FrequencyScanner()
+        scanner = shared_scanner
+        scanner.reset()  # advances the scan index
         all_freqs = scanner.all_frequencies
         
         # Should cycle through all frequencies
@@ -357,6 +353,24 @@ class TestLockUnlockTransitions:
         assert scanner.state == ScanState.SCANNING
         assert scanner.locked_frequency is None
     
+    def test_bulk_detections_match_single_calls(self):
+        """Test record_detections_bulk matches repeated record_detection.
+        
+        **Validates: Requirements 2.3, 2.4**
+        """
+        sequence = [False] * 5 + [True] + [False] * 12
+        bulk = FrequencyScanner()
+        single = FrequencyScanner()
+        bulk.lock_frequency(2414.5e6)
+        single.lock_frequency(2414.5e6)
+        
+        bulk.record_detections_bulk(sequence)
+        for detected in sequence:
+            single.record_detection(detected)
+        
+        assert bulk.state == single.state == ScanState.SCANNING
+        assert bulk.empty_scan_count == single.empty_scan_count
+    
     def test_reset_returns_to_initial_state(self):
         """Test that reset() returns scanner to initial state."""
         scanner = FrequencyScanner()
@@ -9,10 +9,12 @@ including path separators and file creation in specified locations.
 
 import os
 import tempfile
+import uuid
 from pathlib import Path
 from datetime import datetime
 
-from hypothesis import given, strategies as st, settings, assume
+import pytest
+from hypothesis import given, settings, strategies as st, assume
 
 from path_utils import (
     get_output_directory,
@@ -23,10 +25,35 @@ from path_utils import (
     create_decoded_bits_filepath,
     normalize_path,
     is_valid_output_path,
-    safe_write_bytes
+    safe_write_bytes,
+    _INVALID_WINDOWS_CHARS,
 )
 
 
+# Name characters plus both separator styles
+_PATH_CHARS = st.characters(whitelist_categories=('L', 'N'), whitelist_characters='_-/\\')
+
+# Properties that hit the filesystem: no deadline, since the first write
+# (or a slow Windows tempdir) can exceed it without anything being wrong.
+# Pure path/string properties keep the profile's deadline.
+_FILE_IO = settings(deadline=None)
+
+
+@pytest.fixture(scope="module")
+def write_dir(tmp_path_factory):
+    """One scratch directory for every safe_write_bytes example.
+    
+    Examples write to unique filenames inside it instead of creating and
+    removing a temporary directory each time.
+    """
+    return tmp_path_factory.mktemp("safe_write")
+
+
+def _unique_file(directory: Path) -> Path:
+    """Return a fresh, not-yet-existing .bin path inside directory."""
+    return directory / f"test_{uuid.uuid4().hex}.bin"
+
+
 class TestWindowsPathHandling:
     """Property tests for Windows path handling."""
     
@@ -38,7 +65,6 @@ class TestWindowsPathHandling:
         min_size=1,
         max_size=50
     ))
-    @settings(max_examples=100)
     def test_normalize_path_produces_valid_path(self, path_segment):
         """
         **Feature: bladerf-a4-refactor, Property 10: Windows Path Handling**
@@ -68,7 +94,6 @@ class TestWindowsPathHandling:
         ),
         st.sampled_from(['bin', 'raw', 'txt', 'dat'])
     )
-    @settings(max_examples=100)
     def test_timestamped_filename_format(self, prefix, extension):
         """
         **Feature: bladerf-a4-refactor, Property 10: Windows Path Handling**
@@ -91,7 +116,6 @@ class TestWindowsPathHandling:
 
     
     @given(st.floats(min_value=1e6, max_value=100e6, allow_nan=False, allow_infinity=False))
-    @settings(max_examples=100)
     def test_raw_samples_filepath_contains_sample_rate(self, sample_rate):
         """
         **Feature: bladerf-a4-refactor, Property 10: Windows Path Handling**
@@ -113,8 +137,8 @@ class TestWindowsPathHandling:
         assert result.suffix == ".raw"
     
     @given(st.binary(min_size=1, max_size=1000))
-    @settings(max_examples=100)
-    def test_safe_write_bytes_creates_file(self, data):
+    @_FILE_IO
+    def test_safe_write_bytes_creates_file(self, write_dir, data):
         """
         **Feature: bladerf-a4-refactor, Property 10: Windows Path Handling**
         **Validates: Requirements 5.3**
@@ -122,29 +146,28 @@ class TestWindowsPathHandling:
         For any binary data, safe_write_bytes SHALL create a file in the
         specified location with the correct content.
         """
-        with tempfile.TemporaryDirectory() as tmpdir:
-            filepath = Path(tmpdir) / "test_output.bin"
-            
-            # Write data
-            result = safe_write_bytes(filepath, data, append=False)
-            
-            # Verify write was successful
-            assert result is True
-            
-            # Verify file exists
-            assert filepath.exists()
-            
-            # Verify content matches
-            with open(filepath, 'rb') as f:
-                written_data = f.read()
-            assert written_data == data
+        filepath = _unique_file(write_dir)
+        
+        # Write data
+        result = safe_write_bytes(filepath, data, append=False)
+        
+        # Verify write was successful
+        assert result is True
+        
+        # Verify file exists
+        assert filepath.exists()
+        
+        # Verify content matches
+        with open(filepath, 'rb') as f:
+            written_data = f.read()
+        assert written_data == data
     
     @given(
         st.binary(min_size=1, max_size=500),
         st.binary(min_size=1, max_size=500)
     )
-    @settings(max_examples=100)
-    def test_safe_write_bytes_append_mode(self, data1, data2):
+    @_FILE_IO
+    def test_safe_write_bytes_append_mode(self, write_dir, data1, data2):
         """
         **Feature: bladerf-a4-refactor, Property 10: Windows Path Handling**
         **Validates: Requirements 5.3**
@@ -152,31 +175,46 @@ class TestWindowsPathHandling:
         For any two binary data chunks, safe_write_bytes in append mode SHALL
         concatenate the data correctly.
         """
-        with tempfile.TemporaryDirectory() as tmpdir:
-            filepath = Path(tmpdir) / "test_append.bin"
-            
-            # Write first chunk
-            result1 = safe_write_bytes(filepath, data1, append=False)
-            assert result1 is True
-            
-            # Append second chunk
-            result2 = safe_write_bytes(filepath, data2, append=True)
-            assert result2 is True
-            
-            # Verify combined content
-            with open(filepath, 'rb') as f:
-                written_data = f.read()
-            assert written_data == data1 + data2
+        filepath = _unique_file(write_dir)
+        
+        # Write first chunk
+        result1 = safe_write_bytes(filepath, data1, append=False)
+        assert result1 is True
+        
+        # Append second chunk
+        result2 = safe_write_bytes(filepath, data2, append=True)
+        assert result2 is True
+        
+        # Verify combined content
+        with open(filepath, 'rb') as f:
+            written_data = f.read()
+        assert written_data == data1 + data2
     
-    @given(st.text(
-        alphabet=st.characters(
-            whitelist_categories=('L', 'N'),
-            whitelist_characters='_-/\\'
-        ),
-        min_size=1,
-        max_size=100
-    ))
-    @settings(max_examples=100)
+    @given(st.lists(st.binary(max_size=200), min_size=1, max_size=20))
+    @_FILE_IO
+    def test_safe_write_bytes_chunk_list(self, write_dir, chunks):
+        """
+        **Feature: bladerf-a4-refactor, Property 10: Windows Path Handling**
+        **Validates: Requirements 5.3**
+        
+        For any list of binary chunks, safe_write_bytes SHALL write their
+        concatenation, as if each chunk had been appended in order.
+        """
+        filepath = _unique_file(write_dir)
+        
+        assert safe_write_bytes(filepath, chunks, append=False) is True
+        
+        with open(filepath, 'rb') as f:
+            written_data = f.read()
+        assert written_data == b"".join(chunks)
+    
+    @given(st.tuples(
+        # Separators and name characters on either side of one guaranteed
+        # letter/digit, so no example is all separators
+        st.text(alphabet=_PATH_CHARS, max_size=50),
+        st.characters(whitelist_categories=('L', 'N')),
+        st.text(alphabet=_PATH_CHARS, max_size=49),
+    ).map("".join))
     def test_path_with_mixed_separators(self, path_str):
         """
         **Feature: bladerf-a4-refactor, Property 10: Windows Path Handling**
@@ -185,10 +223,6 @@ class TestWindowsPathHandling:
         For any path string with mixed separators (forward and back slashes),
         normalize_path SHALL produce a valid Path object.
         """
-        assume(len(path_str.strip()) > 0)
-        # Filter out paths that are just separators
-        assume(any(c not in '/\\' for c in path_str))
-        
         result = normalize_path(path_str)
         
         # Verify result is a Path object
@@ -226,6 +260,15 @@ class TestOutputDirectoryHandling:
         result = create_decoded_bits_filepath(timestamp=test_time)
         
         assert result.name == "decoded_bits_2003_0945.bin"
+    
+    def test_timestamped_filename_tracks_each_minute(self):
+        """Test cached filenames still change with the timestamp minute."""
+        first = create_timestamped_filename("decoded_bits", "bin", datetime(2024, 3, 20, 9, 45))
+        again = create_timestamped_filename("decoded_bits", "bin", datetime(2024, 3, 20, 9, 45, 30))
+        later = create_timestamped_filename("decoded_bits", "bin", datetime(2024, 3, 20, 9, 46))
+        
+        assert first == again == "decoded_bits_2003_0945.bin"
+        assert later == "decoded_bits_2003_0946.bin"
 
 
 class TestPathValidation:
@@ -242,3 +285,11 @@ class TestPathValidation:
         if os.name == 'nt':
             invalid_path = Path("test<file>.bin")
             assert is_valid_output_path(invalid_path) is False
+    
+    @pytest.mark.parametrize("name, invalid", [
+        ("output.bin", False),
+        ("decoded_bits_2003_0945.bin", False),
+    ] + [(f"test{c}file.bin", True) for c in '<>:"|?*'])
+    def test_invalid_windows_chars_pattern(self, name, invalid):
+        """Test the Windows filename pattern on every platform."""
+        assert bool(_INVALID_WINDOWS_CHARS.search(name)) is invalid
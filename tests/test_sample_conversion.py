@@ -9,23 +9,29 @@ values in the range [-1.0, 1.0] and correct I/Q pairing.
 """
 
 import numpy as np
-from hypothesis import given, strategies as st, settings
+from hypothesis import given, strategies as st
+from hypothesis.extra import numpy as hnp
 
 from bladerf_receiver import BladeRFReceiver
 
 
+def _iq_arrays(min_value: int, max_value: int, max_pairs: int):
+    """(N, 2) little-endian int16 arrays of I/Q pairs, drawn as NumPy arrays.
+    
+    Rows are interleaved I, Q as on the wire, so arr.tobytes() is the
+    SC16_Q11 buffer.
+    """
+    return hnp.arrays(
+        np.dtype('<i2'),
+        st.tuples(st.integers(min_value=1, max_value=max_pairs), st.just(2)),
+        elements=st.integers(min_value=min_value, max_value=max_value),
+    )
+
+
 class TestSampleFormatConversion:
     """Property tests for sample format conversion."""
     
-    @given(st.lists(
-        st.tuples(
-            st.integers(min_value=-2048, max_value=2047),  # I component (12-bit range)
-            st.integers(min_value=-2048, max_value=2047)   # Q component (12-bit range)
-        ),
-        min_size=1,
-        max_size=1000
-    ))
-    @settings(max_examples=100)
+    @given(_iq_arrays(-2048, 2047, max_pairs=1000))  # 12-bit I/Q range
     def test_sc16_q11_to_complex64_range(self, iq_pairs):
         """
         **Feature: bladerf-a4-refactor, Property 1: Sample Format Conversion**
@@ -34,12 +40,8 @@ class TestSampleFormatConversion:
         For any array of SC16_Q11 formatted samples, converting to complex64 
         format SHALL produce values in the range [-1.0, 1.0].
         """
-        # Create SC16_Q11 buffer from I/Q pairs
-        buf = bytearray()
-        for i_val, q_val in iq_pairs:
-            # Pack as little-endian int16
-            buf.extend(int(i_val).to_bytes(2, byteorder='little', signed=True))
-            buf.extend(int(q_val).to_bytes(2, byteorder='little', signed=True))
+        # SC16_Q11 buffer straight from the I/Q array
+        buf = iq_pairs.tobytes()
         
         # Convert using the BladeRFReceiver method
         samples = BladeRFReceiver._convert_sc16_q11_to_complex64(buf)
@@ -47,21 +49,12 @@ class TestSampleFormatConversion:
         # Verify output is complex64
         assert samples.dtype == np.complex64
         
-        # Verify all values are in range [-1.0, 1.0]
-        assert np.all(np.real(samples) >= -1.0)
-        assert np.all(np.real(samples) <= 1.0)
-        assert np.all(np.imag(samples) >= -1.0)
-        assert np.all(np.imag(samples) <= 1.0)
+        # Verify all values are in range [-1.0, 1.0]: view the complex64
+        # output as interleaved float32 I/Q (no copy) and bound both at once
+        flat = samples.view(np.float32)
+        assert flat.min() >= -1.0 and flat.max() <= 1.0
 
-    @given(st.lists(
-        st.tuples(
-            st.integers(min_value=-2048, max_value=2047),
-            st.integers(min_value=-2048, max_value=2047)
-        ),
-        min_size=1,
-        max_size=1000
-    ))
-    @settings(max_examples=100)
+    @given(_iq_arrays(-2048, 2047, max_pairs=1000))
     def test_sc16_q11_to_complex64_iq_pairing(self, iq_pairs):
         """
         **Feature: bladerf-a4-refactor, Property 1: Sample Format Conversion**
@@ -70,11 +63,8 @@ class TestSampleFormatConversion:
         For any array of SC16_Q11 formatted samples, the I and Q components
         SHALL be correctly paired in the resulting complex64 array.
         """
-        # Create SC16_Q11 buffer from I/Q pairs
-        buf = bytearray()
-        for i_val, q_val in iq_pairs:
-            buf.extend(int(i_val).to_bytes(2, byteorder='little', signed=True))
-            buf.extend(int(q_val).to_bytes(2, byteorder='little', signed=True))
+        # SC16_Q11 buffer straight from the I/Q array
+        buf = iq_pairs.tobytes()
         
         # Convert using the BladeRFReceiver method
         samples = BladeRFReceiver._convert_sc16_q11_to_complex64(buf)
@@ -82,25 +72,13 @@ class TestSampleFormatConversion:
         # Verify correct number of samples
         assert len(samples) == len(iq_pairs)
         
-        # Verify I/Q pairing is correct
-        scale_factor = 2048.0
-        for idx, (i_val, q_val) in enumerate(iq_pairs):
-            expected_i = i_val / scale_factor
-            expected_q = q_val / scale_factor
-            
-            # Use approximate comparison due to float precision
-            assert np.isclose(np.real(samples[idx]), expected_i, rtol=1e-5)
-            assert np.isclose(np.imag(samples[idx]), expected_q, rtol=1e-5)
+        # Verify I/Q pairing is correct: column 0 -> real, column 1 -> imag,
+        # compared for the whole array at once
+        expected = iq_pairs.astype(np.float32) / 2048.0
+        assert np.allclose(samples.real, expected[:, 0], rtol=1e-5)
+        assert np.allclose(samples.imag, expected[:, 1], rtol=1e-5)
     
-    @given(st.lists(
-        st.tuples(
-            st.integers(min_value=-32768, max_value=32767),  # Full int16 range
-            st.integers(min_value=-32768, max_value=32767)
-        ),
-        min_size=1,
-        max_size=500
-    ))
-    @settings(max_examples=100)
+    @given(_iq_arrays(-32768, 32767, max_pairs=500))  # Full int16 range
     def test_sc16_q11_handles_full_int16_range(self, iq_pairs):
         """
         **Feature: bladerf-a4-refactor, Property 1: Sample Format Conversion**
@@ -109,18 +87,14 @@ class TestSampleFormatConversion:
         For any array of SC16_Q11 formatted samples using the full int16 range,
         conversion SHALL not produce NaN or Inf values.
         """
-        # Create SC16_Q11 buffer from I/Q pairs
-        buf = bytearray()
-        for i_val, q_val in iq_pairs:
-            buf.extend(int(i_val).to_bytes(2, byteorder='little', signed=True))
-            buf.extend(int(q_val).to_bytes(2, byteorder='little', signed=True))
+        # SC16_Q11 buffer straight from the I/Q array
+        buf = iq_pairs.tobytes()
         
         # Convert using the BladeRFReceiver method
         samples = BladeRFReceiver._convert_sc16_q11_to_complex64(buf)
         
-        # Verify no NaN or Inf values
-        assert not np.any(np.isnan(samples))
-        assert not np.any(np.isinf(samples))
+        # Verify no NaN or Inf values: one isfinite pass over both I and Q
+        assert np.isfinite(samples.view(np.float32)).all()
         
         # Verify output is complex64
         assert samples.dtype == np.complex64
@@ -11,13 +11,58 @@ complex64 sample format produced by BladeRF.
 import numpy as np
 import pytest
 from pathlib import Path
-from hypothesis import given, strategies as st, settings, assume
+from hypothesis import Phase, given, settings, strategies as st, assume
 
 # Import signal processing components
 from SpectrumCapture import SpectrumCapture
 from helpers import estimate_offset, resample
 from packetizer import find_packet_candidate_time
 
+# For tests that run resample() per example: keep the active profile but
+# skip the shrink phase, which would re-run the DSP hundreds of times on a
+# failure. The unshrunk failing example is still reported. No deadline,
+# since a cold first call can exceed it without anything being wrong.
+_NO_SHRINK = settings(
+    phases=[Phase.explicit, Phase.reuse, Phase.generate, Phase.target],
+    deadline=None,
+)
+
+
+def _complex64_noise(rng: np.random.Generator, num_samples: int) -> np.ndarray:
+    """Complex64 Gaussian noise, unit-variance I and Q drawn directly as float32."""
+    noise = np.empty(num_samples, dtype=np.complex64)
+    noise.real = rng.standard_normal(num_samples, dtype=np.float32)
+    noise.imag = rng.standard_normal(num_samples, dtype=np.float32)
+    return noise
+
+
+@pytest.fixture(scope="module")
+def noise_50mhz_100ms():
+    """100 ms of complex64 noise at 50 MHz, peaking just under 0.1.
+    
+    Built once per module from a fixed seed and marked read-only, since
+    the tests that share it only feed it to the detectors. Its users share
+    the "dsp_noise" xdist group so it is only built on one worker.
+    """
+    noise = _complex64_noise(np.random.default_rng(42), int(50e6 * 0.1))
+    # Fixed scale instead of a max(abs) pass: unit-variance I/Q peaks at
+    # |z| ~ 5.6 over 5M samples, so scaling by 0.1/6 keeps it under 0.1
+    noise *= np.float32(0.1 / 6.0)
+    noise.setflags(write=False)
+    return noise
+
+
+# One fixed-seed random signal for the resampling properties; examples
+# slice it, so Hypothesis only draws (and shrinks) a length
+_BASE_SIGNAL = _complex64_noise(np.random.default_rng(7), 50000)
+_BASE_SIGNAL.setflags(write=False)
+
+
+@st.composite
+def complex64_signal(draw, min_len=1000, max_len=len(_BASE_SIGNAL)):
+    """Strategy for a complex64 random signal of min_len..max_len samples."""
+    return _BASE_SIGNAL[:draw(st.integers(min_value=min_len, max_value=max_len))]
+
 
 class TestSpectrumCaptureWithBladeRFFormat:
     """Tests for SpectrumCapture with BladeRF complex64 sample format.
@@ -25,18 +70,15 @@ class TestSpectrumCaptureWithBladeRFFormat:
     **Validates: Requirements 3.1, 3.3**
     """
     
-    def test_spectrum_capture_accepts_complex64(self):
+    @pytest.mark.slow
+    @pytest.mark.xdist_group("dsp_noise")
+    def test_spectrum_capture_accepts_complex64(self, noise_50mhz_100ms):
         """Test that SpectrumCapture accepts complex64 samples.
         
         **Validates: Requirements 3.1**
         """
-        # Create synthetic complex64 samples (noise)
-        num_samples = int(50e6 * 0.1)  # 100ms at 50 MHz
-        samples = np.random.randn(num_samples) + 1j * np.random.randn(num_samples)
-        samples = samples.astype(np.complex64)
-        
-        # Normalize to [-1, 1] range like BladeRF output
-        samples = samples / np.max(np.abs(samples))
+        # Synthetic complex64 noise within the [-1, 1] range of BladeRF output
+        samples = noise_50mhz_100ms
         
         # SpectrumCapture should accept this without error
         capture = SpectrumCapture(raw_data=samples, Fs=50e6, debug=False)
@@ -54,9 +96,9 @@ class TestSpectrumCaptureWithBladeRFFormat:
         if not sample_path.exists():
             pytest.skip("Sample file not found")
         
-        # Load sample file (little-endian float32 interleaved I/Q)
-        raw_data = np.fromfile(sample_path, dtype="<f").astype(np.float32)
-        samples = raw_data.view(np.complex64)
+        # Map the sample file (little-endian float32 interleaved I/Q) read-only;
+        # pages are only read as the detector touches them
+        samples = np.memmap(sample_path, dtype="<f4", mode="r").view(np.complex64)
         
         # Process with SpectrumCapture
         capture = SpectrumCapture(raw_data=samples, Fs=50e6, debug=False)
@@ -82,8 +124,8 @@ class TestSpectrumCaptureWithBladeRFFormat:
         for freq in np.linspace(-4e6, 4e6, 20):
             signal += np.exp(2j * np.pi * freq * t)
         
-        signal = signal.astype(np.complex64)
-        signal = signal / np.max(np.abs(signal))
+        # 20 unit tones all in phase at t=0 peak at exactly 20
+        signal /= 20
         
         # Estimate offset
         offset, found = estimate_offset(signal, Fs, debug=False)
@@ -101,7 +143,6 @@ class TestPacketLengthFiltering:
     """
     
     @given(st.floats(min_value=630e-6, max_value=665e-6, allow_nan=False, allow_infinity=False))
-    @settings(max_examples=100)
     def test_standard_droneid_packet_length_accepted(self, packet_duration):
         """
         **Feature: bladerf-a4-refactor, Property 4: Packet Length Filtering**
@@ -123,7 +164,6 @@ class TestPacketLengthFiltering:
         # which uses these bounds
     
     @given(st.floats(min_value=565e-6, max_value=600e-6, allow_nan=False, allow_infinity=False))
-    @settings(max_examples=100)
     def test_legacy_droneid_packet_length_accepted(self, packet_duration):
         """
         **Feature: bladerf-a4-refactor, Property 4: Packet Length Filtering**
@@ -138,7 +178,6 @@ class TestPacketLengthFiltering:
         assert min_packet_len_t <= packet_duration <= max_packet_len_t
     
     @given(st.floats(min_value=0, max_value=500e-6, allow_nan=False, allow_infinity=False))
-    @settings(max_examples=100)
     def test_short_packets_rejected(self, packet_duration):
         """
         **Feature: bladerf-a4-refactor, Property 4: Packet Length Filtering**
@@ -157,7 +196,6 @@ class TestPacketLengthFiltering:
         assert packet_duration < standard_min
     
     @given(st.floats(min_value=700e-6, max_value=1000e-6, allow_nan=False, allow_infinity=False))
-    @settings(max_examples=100)
     def test_long_packets_rejected(self, packet_duration):
         """
         **Feature: bladerf-a4-refactor, Property 4: Packet Length Filtering**
@@ -183,49 +221,21 @@ class TestResamplingRatio:
     **Validates: Requirements 3.4**
     """
     
-    @given(st.integers(min_value=1000, max_value=100000))
-    @settings(max_examples=100)
-    def test_resampling_ratio_preserves_sample_count_ratio(self, input_length):
-        """
-        **Feature: bladerf-a4-refactor, Property 5: Resampling Ratio**
-        **Validates: Requirements 3.4**
-        
-        For any input signal at 50 MHz sample rate, resampling to 15.36 MHz
-        SHALL reduce the sample count by the ratio 50/15.36.
-        """
-        Fs_input = 50e6
-        Fs_output = 15.36e6
-        expected_ratio = Fs_input / Fs_output
-        
-        # Create random input signal
-        input_signal = np.random.randn(input_length) + 1j * np.random.randn(input_length)
-        input_signal = input_signal.astype(np.complex64)
-        
-        # Resample
-        output_signal = resample(input_signal, Fs_input, Fs_output)
-        
-        # Calculate actual ratio
-        actual_ratio = input_length / len(output_signal)
-        
-        # Should be close to expected ratio (within 1% tolerance)
-        assert abs(actual_ratio - expected_ratio) / expected_ratio < 0.01
-    
-    @given(st.integers(min_value=10000, max_value=500000))
-    @settings(max_examples=100)
-    def test_resampling_output_length_correct(self, input_length):
+    # Length correctness doesn't depend on scale, so 50k samples is enough
+    @pytest.mark.parametrize("Fs_input, Fs_output", [(50e6, 15.36e6), (30e6, 10e6)])
+    @given(complex64_signal())
+    @_NO_SHRINK
+    def test_resampling_output_length_correct(self, Fs_input, Fs_output, input_signal):
         """
         **Feature: bladerf-a4-refactor, Property 5: Resampling Ratio**
         **Validates: Requirements 3.4**
         
         For any input signal length, the output length after resampling
-        SHALL equal int(input_length * Fs_output / Fs_input).
+        SHALL equal int(input_length * Fs_output / Fs_input), so the sample
+        count shrinks by the ratio Fs_input/Fs_output (50/15.36 for the
+        receiver's own rates).
         """
-        Fs_input = 50e6
-        Fs_output = 15.36e6
-        
-        # Create random input signal
-        input_signal = np.random.randn(input_length) + 1j * np.random.randn(input_length)
-        input_signal = input_signal.astype(np.complex64)
+        input_length = len(input_signal)
         
         # Resample
         output_signal = resample(input_signal, Fs_input, Fs_output)
@@ -235,14 +245,19 @@ class TestResamplingRatio:
         
         # Allow for small rounding differences (within 1 sample)
         assert abs(len(output_signal) - expected_length) <= 1
+        
+        # Sample count ratio within 1% of the rate ratio
+        expected_ratio = Fs_input / Fs_output
+        actual_ratio = input_length / len(output_signal)
+        assert abs(actual_ratio - expected_ratio) / expected_ratio < 0.01
     
     @given(
-        st.integers(min_value=5000, max_value=50000),
+        complex64_signal(min_len=5000),
         st.floats(min_value=10e6, max_value=100e6, allow_nan=False, allow_infinity=False),
         st.floats(min_value=1e6, max_value=50e6, allow_nan=False, allow_infinity=False)
     )
-    @settings(max_examples=100)
-    def test_resampling_with_various_rates(self, input_length, Fs_input, Fs_output):
+    @_NO_SHRINK
+    def test_resampling_with_various_rates(self, input_signal, Fs_input, Fs_output):
         """
         **Feature: bladerf-a4-refactor, Property 5: Resampling Ratio**
         **Validates: Requirements 3.4**
@@ -253,20 +268,16 @@ class TestResamplingRatio:
         # Ensure output rate is less than input rate
         assume(Fs_output < Fs_input)
         
-        # Create random input signal
-        input_signal = np.random.randn(input_length) + 1j * np.random.randn(input_length)
-        input_signal = input_signal.astype(np.complex64)
-        
         # Resample
         output_signal = resample(input_signal, Fs_input, Fs_output)
         
         # Expected output length
-        expected_length = int(input_length * Fs_output / Fs_input)
+        expected_length = int(len(input_signal) * Fs_output / Fs_input)
         
         # Allow for small rounding differences
         assert abs(len(output_signal) - expected_length) <= 1
     
-    def test_resampling_50mhz_to_15_36mhz_specific(self):
+    def test_resampling_50mhz_to_15_36mhz_specific(self, rng):
         """Test specific 50 MHz to 15.36 MHz resampling case.
         
         **Validates: Requirements 3.4**
@@ -278,8 +289,7 @@ class TestResamplingRatio:
         duration = 0.001
         input_length = int(Fs_input * duration)
         
-        input_signal = np.random.randn(input_length) + 1j * np.random.randn(input_length)
-        input_signal = input_signal.astype(np.complex64)
+        input_signal = _complex64_noise(rng, input_length)
         
         # Resample
         output_signal = resample(input_signal, Fs_input, Fs_output)
@@ -300,18 +310,17 @@ class TestPacketDetectionWithBladeRFSamples:
     **Validates: Requirements 3.1**
     """
     
-    def test_packet_detection_with_noise(self):
+    @pytest.mark.slow
+    @pytest.mark.xdist_group("dsp_noise")
+    def test_packet_detection_with_noise(self, noise_50mhz_100ms):
         """Test packet detection handles noise-only input.
         
         **Validates: Requirements 3.1**
         """
         Fs = 50e6
-        duration = 0.1  # 100ms
-        num_samples = int(Fs * duration)
         
-        # Create noise-only signal (complex64 like BladeRF output)
-        noise = np.random.randn(num_samples) + 1j * np.random.randn(num_samples)
-        noise = (noise / np.max(np.abs(noise)) * 0.1).astype(np.complex64)
+        # Noise-only signal (complex64 like BladeRF output)
+        noise = noise_50mhz_100ms
         
         # Should not crash and should return empty or minimal packets
         packets, cfo = find_packet_candidate_time(noise, Fs, debug=False)
@@ -328,9 +337,8 @@ class TestPacketDetectionWithBladeRFSamples:
         if not sample_path.exists():
             pytest.skip("Sample file not found")
         
-        # Load sample file
-        raw_data = np.fromfile(sample_path, dtype="<f").astype(np.float32)
-        samples = raw_data.view(np.complex64)
+        # Map the sample file read-only instead of reading and copying it
+        samples = np.memmap(sample_path, dtype="<f4", mode="r").view(np.complex64)
         
         # Run packet detection
         packets, cfo = find_packet_candidate_time(samples, 50e6, debug=False)